@@ -6,18 +6,30 @@ This script:
 1. Deploys Kubernetes resources using Helm chart
 2. Accepts --node-count parameter for Chrome node replicas (min=1, max=5)
 3. Waits for all pods to be ready
-4. Monitors test execution and displays results
+4. Streams test logs while tests run and reports the result
 5. Cleans up resources after test completion
 """
 
 import argparse
+import codecs
+import os
 import sys
 import time
 import subprocess
-from kubernetes import client, config
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 
 
+RELEASE_NAME = "insider-tests"
+
+# app.kubernetes.io/component label values set by the Helm chart
+COMPONENT_LABEL = "app.kubernetes.io/component"
+CHROME_NODE_COMPONENT = "chrome-node"
+TEST_CONTROLLER_COMPONENT = "test-controller"
+
+
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
@@ -62,12 +74,11 @@ def parse_args():
 
 
 def run_command(cmd, description, check=True):
-    """Run shell command and handle errors"""
+    """Run command (argv list, no shell) and handle errors"""
     print(f"  → {description}...")
     try:
         result = subprocess.run(
             cmd,
-            shell=True,
             capture_output=True,
             text=True,
             check=check
@@ -85,6 +96,10 @@ def run_command(cmd, description, check=True):
         if e.stderr:
             print(f"    Error: {e.stderr}")
         return None
+    except OSError as e:
+        # Without a shell, a missing binary raises instead of exiting 127
+        print(f"    ✗ {description} failed: {e}")
+        return None
 
 
 def deploy_with_helm(args):
@@ -93,28 +108,18 @@ def deploy_with_helm(args):
     print("DEPLOYING WITH HELM")
     print(f"{'='*60}\n")
 
-    release_name = "insider-tests"
+    release_name = RELEASE_NAME
 
-    # Check if Helm release exists
-    check_cmd = f"helm list -n {args.namespace} | grep {release_name}"
-    existing = run_command(check_cmd, "Checking existing Helm release", check=False)
-
-    # Prepare Helm command
-    if existing:
-        helm_cmd = f"helm upgrade {release_name} {args.helm_chart_path}"
-        action = "Upgrading"
-    else:
-        helm_cmd = f"helm install {release_name} {args.helm_chart_path}"
-        action = "Installing"
-
-    helm_cmd += f" --set chromeNode.nodeCount={args.node_count}"
-    helm_cmd += f" --namespace {args.namespace}"
-    helm_cmd += " --create-namespace"
+    # Single Helm invocation: installs the release or upgrades it in place
+    helm_cmd = ["helm", "upgrade", "--install", release_name, args.helm_chart_path]
+    helm_cmd += ["--set", f"chromeNode.nodeCount={args.node_count}"]
+    helm_cmd += ["--namespace", args.namespace]
+    helm_cmd += ["--create-namespace"]
     if args.values_file:
-        helm_cmd += f" -f {args.values_file}"
-    helm_cmd += " --wait --timeout 5m"
+        helm_cmd += ["-f", args.values_file]
+    # No --wait: wait_for_pods_ready watches the rollout itself
 
-    result = run_command(helm_cmd, f"{action} Helm chart")
+    result = run_command(helm_cmd, "Installing/upgrading Helm chart")
 
     if result is None:
         print("\n✗ Helm deployment failed")
@@ -127,9 +132,13 @@ def deploy_with_helm(args):
 
 
 def load_kube_config():
-    """Load Kubernetes configuration"""
+    """Load Kubernetes configuration (service account when running in a pod)"""
     try:
-        config.load_kube_config()
+        if os.getenv('KUBERNETES_SERVICE_HOST'):
+            # Mounted service-account token: no kubeconfig parsing or exec plugins
+            config.load_incluster_config()
+        else:
+            config.load_kube_config()
         print("✓ Kubernetes config loaded successfully")
         return True
     except Exception as e:
@@ -137,122 +146,292 @@ def load_kube_config():
         return False
 
 
-def wait_for_pods_ready(core_v1, namespace, timeout):
-    """Wait for all pods to be ready"""
-    print(f"\n{'='*60}")
-    print("WAITING FOR PODS")
-    print(f"{'='*60}\n")
-    print(f"Timeout: {timeout}s\n")
+def watch_pod_events(core_v1, namespace, timeout, **selectors):
+    """
+    Stream pod changes from the API server instead of polling
+
+    Seeds state with a single list call served from the API server cache,
+    then follows a watch from the returned resourceVersion. If the watch
+    expires (410 Gone) the pods are re-listed and the watch resumes.
+    Reconnects after a dropped or idle stream back off exponentially
+    (0.5s doubling up to 10s) and reset once events flow again.
+
+    Args:
+        core_v1: CoreV1Api client
+        namespace: Kubernetes namespace
+        timeout: Maximum time to watch in seconds
+        **selectors: label_selector / field_selector passed to the API
+
+    Yields:
+        List of (event_type, pod) tuples to apply together
+    """
+    deadline = time.time() + timeout
+    known = {}
+    resource_version = None
+    delay = 0.5
+
+    while time.time() < deadline:
+        if resource_version is None:
+            pods = core_v1.list_namespaced_pod(
+                namespace=namespace,
+                # Serve from the API server watch cache instead of etcd
+                resource_version="0",
+                resource_version_match="NotOlderThan",
+                **selectors
+            )
+            resource_version = pods.metadata.resource_version
+            current = {pod.metadata.name: pod for pod in pods.items}
 
-    start_time = time.time()
+            # Report pods that vanished while the watch was not running
+            batch = [('DELETED', pod) for name, pod in known.items()
+                     if name not in current]
+            batch += [('ADDED', pod) for pod in current.values()]
+            known = current
+            yield batch
 
-    while time.time() - start_time < timeout:
+        w = watch.Watch()
         try:
-            # Get all pods
-            pods = core_v1.list_namespaced_pod(namespace=namespace)
-
-            chrome_pods = []
-            test_pod = None
+            for event in w.stream(
+                core_v1.list_namespaced_pod,
+                namespace=namespace,
+                resource_version=resource_version,
+                timeout_seconds=max(1, int(deadline - time.time())),
+                **selectors
+            ):
+                pod = event['object']
+                resource_version = pod.metadata.resource_version
+                if event['type'] == 'DELETED':
+                    known.pop(pod.metadata.name, None)
+                else:
+                    known[pod.metadata.name] = pod
+                delay = 0.5
+                yield [(event['type'], pod)]
+        except ApiException as e:
+            if e.status != 410:
+                raise
+            # Watch history expired, re-list from the cache
+            resource_version = None
+            continue
+        except urllib3.exceptions.HTTPError as e:
+            print(f"\n  Watch connection lost ({e}), reconnecting...")
+        finally:
+            w.stop()
+
+        time.sleep(max(0, min(delay, deadline - time.time())))
+        delay = min(delay * 2, 10.0)
+
+
+def apply_pod_events(pods, batch):
+    """Apply a batch of watch events to a dict of pods keyed by name"""
+    for event_type, pod in batch:
+        if event_type == 'DELETED':
+            pods.pop(pod.metadata.name, None)
+        else:
+            pods[pod.metadata.name] = pod
+
+
+def write_status(status, last_write, force=False):
+    """
+    Rewrite the single-line progress status, at most once per second
+
+    Args:
+        status: Status text to show
+        last_write: time.monotonic() of the previous write
+        force: Write even if the last write was less than a second ago
+
+    Returns:
+        time.monotonic() of the last write
+    """
+    now = time.monotonic()
+    if force or now - last_write >= 1.0:
+        sys.stdout.write(f"\r{status}")
+        sys.stdout.flush()
+        return now
+    return last_write
+
+
+def is_pod_ready(pod):
+    """Check if pod is running and reports the Ready condition"""
+    return pod.status.phase == 'Running' and any(
+        c.type == 'Ready' and c.status == 'True'
+        for c in pod.status.conditions or ()
+    )
 
-            for pod in pods.items:
-                # Skip completed/failed pods
-                if pod.status.phase in ['Succeeded', 'Failed']:
-                    continue
 
-                if 'chrome-node' in pod.metadata.name:
-                    chrome_pods.append(pod)
-                elif 'test-controller' in pod.metadata.name:
-                    test_pod = pod
+def wait_for_pods_ready(core_v1, namespace, node_count, timeout):
+    """Wait for node_count Chrome node pods to be ready"""
+    print(f"\n{'='*60}")
+    print("WAITING FOR PODS")
+    print(f"{'='*60}\n")
+    print(f"Timeout: {timeout}s\n")
 
-            # Check chrome nodes ready
-            chrome_ready = sum(1 for pod in chrome_pods
-                             if pod.status.phase == 'Running'
-                             and any(c.type == 'Ready' and c.status == 'True'
-                                   for c in (pod.status.conditions or [])))
+    # Readiness is computed once per pod event, not per pod on every check
+    chrome_ready_map = {}
+    test_status = None
+    last_write = 0.0
 
-            print(f"  Chrome Nodes: {chrome_ready}/{len(chrome_pods)} ready", end='')
+    try:
+        for batch in watch_pod_events(
+            core_v1, namespace, timeout,
+            label_selector=f"app.kubernetes.io/instance={RELEASE_NAME}",
+            # Completed/failed pods are filtered out by the API server
+            field_selector="status.phase!=Succeeded,status.phase!=Failed"
+        ):
+            for event_type, pod in batch:
+                component = (pod.metadata.labels or {}).get(COMPONENT_LABEL)
+                if component == CHROME_NODE_COMPONENT:
+                    if event_type == 'DELETED':
+                        chrome_ready_map.pop(pod.metadata.name, None)
+                    else:
+                        # Pods being replaced on upgrade/scale-down don't count
+                        chrome_ready_map[pod.metadata.name] = (
+                            is_pod_ready(pod) and not pod.metadata.deletion_timestamp
+                        )
+                elif component == TEST_CONTROLLER_COMPONENT:
+                    test_status = None if event_type == 'DELETED' else pod.status.phase
+
+            # Check chrome nodes ready against the requested count; Helm no
+            # longer waits, so pods for new replicas may not exist yet
+            chrome_ready = sum(chrome_ready_map.values())
+
+            all_ready = chrome_ready >= node_count
+
+            status = f"  Chrome Nodes: {chrome_ready}/{node_count} ready"
 
             # Check test controller
-            if test_pod:
-                test_status = test_pod.status.phase
-                print(f" | Test Controller: {test_status}", end='')
+            if test_status:
+                status += f" | Test Controller: {test_status}"
 
-            print('\r', end='')
+            last_write = write_status(status, last_write, force=all_ready)
 
             # All chrome nodes ready
-            if len(chrome_pods) > 0 and chrome_ready == len(chrome_pods):
-                print(f"\n\n✓ All {len(chrome_pods)} Chrome nodes are ready")
+            if all_ready:
+                print(f"\n\n✓ All {node_count} Chrome nodes are ready")
                 return True
 
-            time.sleep(2)
-
-        except ApiException as e:
-            print(f"\n✗ Error checking pod status: {e}")
-            return False
+    except ApiException as e:
+        print(f"\n✗ Error checking pod status: {e}")
+        return False
 
     print(f"\n✗ Timeout waiting for pods to be ready")
     return False
 
 
-def wait_for_test_completion(core_v1, namespace, timeout):
-    """Wait for test controller job to complete"""
+def wait_for_test_start(core_v1, namespace, timeout):
+    """Wait for the test controller pod to start running"""
     print(f"\n{'='*60}")
     print("WAITING FOR TEST EXECUTION")
     print(f"{'='*60}\n")
 
-    start_time = time.time()
+    pods = {}
+    last_write = 0.0
 
-    while time.time() - start_time < timeout:
-        try:
-            pods = core_v1.list_namespaced_pod(
-                namespace=namespace,
-                label_selector="app.kubernetes.io/component=test-controller"
-            )
+    try:
+        for batch in watch_pod_events(
+            core_v1, namespace, timeout,
+            label_selector=f"app.kubernetes.io/instance={RELEASE_NAME},{COMPONENT_LABEL}={TEST_CONTROLLER_COMPONENT}"
+        ):
+            apply_pod_events(pods, batch)
 
-            if not pods.items:
-                time.sleep(2)
+            if not pods:
                 continue
 
-            pod = pods.items[0]
+            # Jobs from earlier revisions may linger until their TTL expires
+            pod = max(pods.values(), key=lambda p: p.metadata.creation_timestamp)
             phase = pod.status.phase
 
-            print(f"  Test Controller Status: {phase}    \r", end='')
+            started = phase != 'Pending'
+            last_write = write_status(
+                f"  Test Controller Status: {phase}    ", last_write, force=started
+            )
 
-            if phase == 'Succeeded':
-                print(f"\n\n✓ Tests completed successfully")
-                return pod.metadata.name
-            elif phase == 'Failed':
-                print(f"\n\n✗ Tests failed")
+            # Logs can be followed once the test-runner container started
+            if started:
+                print(f"\n\n✓ Test controller started: {pod.metadata.name}")
                 return pod.metadata.name
 
-            time.sleep(2)
-
-        except ApiException as e:
-            print(f"\n✗ Error waiting for test completion: {e}")
-            return None
+    except ApiException as e:
+        print(f"\n✗ Error waiting for test execution: {e}")
+        return None
 
-    print(f"\n✗ Timeout waiting for test completion")
+    print(f"\n✗ Timeout waiting for test execution")
     return None
 
 
-def get_test_logs(core_v1, namespace, pod_name):
-    """Get logs from test controller pod"""
+def stream_test_logs(core_v1, namespace, pod_name):
+    """Follow logs from test controller pod until the container exits"""
     print(f"\n{'='*60}")
     print("TEST EXECUTION RESULTS")
     print(f"{'='*60}\n")
 
     try:
-        logs = core_v1.read_namespaced_pod_log(
+        response = core_v1.read_namespaced_pod_log(
             name=pod_name,
             namespace=namespace,
-            container='test-runner'
+            container='test-runner',
+            follow=True,
+            _preload_content=False
         )
-        print(logs)
-        return True
     except ApiException as e:
         print(f"✗ Failed to get logs: {e}")
         return False
 
+    # Chunks can split multi-byte characters, so decode incrementally
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    try:
+        for chunk in response.stream():
+            sys.stdout.write(decoder.decode(chunk))
+            sys.stdout.flush()
+        sys.stdout.write(decoder.decode(b'', final=True))
+    except urllib3.exceptions.HTTPError as e:
+        # A dropped follow connection only truncates the output; the final
+        # phase is still read by wait_for_test_completion
+        print(f"\n⚠ Log stream interrupted: {e}")
+    finally:
+        response.release_conn()
+
+    return True
+
+
+def wait_for_test_completion(core_v1, namespace, pod_name, timeout):
+    """
+    Get the final phase of the test controller pod
+
+    Called once the log stream has ended, so the pod is normally finished;
+    the watch only covers the short delay before the kubelet reports it.
+
+    Returns:
+        'Succeeded' or 'Failed', None on error/timeout
+    """
+    try:
+        pod = core_v1.read_namespaced_pod(name=pod_name, namespace=namespace)
+        phase = pod.status.phase
+
+        if phase not in ['Succeeded', 'Failed']:
+            pods = {}
+            for batch in watch_pod_events(
+                core_v1, namespace, timeout,
+                field_selector=f"metadata.name={pod_name}"
+            ):
+                apply_pod_events(pods, batch)
+                if pod_name in pods and pods[pod_name].status.phase in ['Succeeded', 'Failed']:
+                    phase = pods[pod_name].status.phase
+                    break
+
+    except ApiException as e:
+        print(f"\n✗ Error waiting for test completion: {e}")
+        return None
+
+    if phase == 'Succeeded':
+        print(f"\n✓ Tests completed successfully")
+    elif phase == 'Failed':
+        print(f"\n✗ Tests failed")
+    else:
+        print(f"\n✗ Timeout waiting for test completion")
+        return None
+
+    return phase
+
 
 def cleanup_resources(args):
     """Clean up Helm release"""
@@ -260,7 +439,7 @@ def cleanup_resources(args):
     print("CLEANUP")
     print(f"{'='*60}\n")
 
-    cmd = f"helm uninstall insider-tests --namespace {args.namespace}"
+    cmd = ["helm", "uninstall", RELEASE_NAME, "--namespace", args.namespace]
     result = run_command(cmd, "Removing Helm release")
 
     if result:
@@ -271,15 +450,29 @@ def cleanup_resources(args):
         return False
 
 
-def display_cluster_info(core_v1, apps_v1, namespace):
+def display_cluster_info(core_v1, apps_v1, batch_v1, namespace):
     """Display cluster deployment information"""
     print(f"\n{'='*60}")
     print("CLUSTER STATUS")
     print(f"{'='*60}\n")
 
+    # Only list objects belonging to this release
+    list_kwargs = {
+        "namespace": namespace,
+        "label_selector": f"app.kubernetes.io/instance={RELEASE_NAME}",
+        "resource_version": "0",
+    }
+
     try:
-        # Get deployments
-        deployments = apps_v1.list_namespaced_deployment(namespace=namespace)
+        # The three list calls are independent, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            deployments_future = executor.submit(apps_v1.list_namespaced_deployment, **list_kwargs)
+            jobs_future = executor.submit(batch_v1.list_namespaced_job, **list_kwargs)
+            services_future = executor.submit(core_v1.list_namespaced_service, **list_kwargs)
+
+        deployments = deployments_future.result()
+        jobs = jobs_future.result()
+        services = services_future.result()
 
         print("Deployments:")
         for dep in deployments.items:
@@ -287,10 +480,6 @@ def display_cluster_info(core_v1, apps_v1, namespace):
             ready = dep.status.ready_replicas or 0
             print(f"  {dep.metadata.name}: {ready}/{replicas} ready")
 
-        # Get jobs
-        batch_v1 = client.BatchV1Api()
-        jobs = batch_v1.list_namespaced_job(namespace=namespace)
-
         print("\nJobs:")
         for job in jobs.items:
             succeeded = job.status.succeeded or 0
@@ -298,13 +487,8 @@ def display_cluster_info(core_v1, apps_v1, namespace):
             active = job.status.active or 0
             print(f"  {job.metadata.name}: Active={active}, Succeeded={succeeded}, Failed={failed}")
 
-        # Get services
-        services = core_v1.list_namespaced_service(namespace=namespace)
-
         print("\nServices:")
         for svc in services.items:
-            if svc.metadata.name == 'kubernetes':
-                continue
             cluster_ip = svc.spec.cluster_ip
             ports = [f"{p.port}/{p.protocol}" for p in svc.spec.ports]
             print(f"  {svc.metadata.name}: {cluster_ip} - {', '.join(ports)}")
@@ -335,30 +519,45 @@ def main():
     if not load_kube_config():
         sys.exit(1)
 
-    # Initialize API clients
-    core_v1 = client.CoreV1Api()
-    apps_v1 = client.AppsV1Api()
+    # Initialize API clients on one shared ApiClient so every call reuses
+    # the same keep-alive urllib3 pool (no new TLS handshake per request)
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = 32
+    api_client = client.ApiClient(configuration)
+    core_v1 = client.CoreV1Api(api_client)
+    apps_v1 = client.AppsV1Api(api_client)
+    batch_v1 = client.BatchV1Api(api_client)
 
     # Wait for Chrome nodes to be ready
-    if not wait_for_pods_ready(core_v1, args.namespace, args.wait_timeout):
+    if not wait_for_pods_ready(core_v1, args.namespace, args.node_count, args.wait_timeout):
+        # Helm no longer waits or rolls back, so remove the failed release here
+        cleanup_resources(args)
         sys.exit(1)
 
     # Display cluster info
-    display_cluster_info(core_v1, apps_v1, args.namespace)
+    display_cluster_info(core_v1, apps_v1, batch_v1, args.namespace)
 
-    # Wait for test completion
-    pod_name = wait_for_test_completion(core_v1, args.namespace, args.wait_timeout)
+    # Wait for test controller to start
+    pod_name = wait_for_test_start(core_v1, args.namespace, args.wait_timeout)
     if not pod_name:
         sys.exit(1)
 
-    # Get and display test logs
-    if not get_test_logs(core_v1, args.namespace, pod_name):
+    # Stream test logs while the tests run
+    if not stream_test_logs(core_v1, args.namespace, pod_name):
+        sys.exit(1)
+
+    # Get final test result
+    phase = wait_for_test_completion(core_v1, args.namespace, pod_name, args.wait_timeout)
+    if not phase:
         sys.exit(1)
 
     # Cleanup if requested
     if args.cleanup:
         cleanup_resources(args)
 
+    if phase == 'Failed':
+        sys.exit(1)
+
     print("\n✓ Deployment and test execution completed successfully\n")
 
 
@@ -6,9 +6,70 @@ import os
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.common.exceptions import WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
 
+# Third-party analytics/tracker requests blocked in the browser (CDP URL patterns)
+BLOCKED_URLS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*hotjar.com*",
+    "*facebook.net*",
+    "*linkedin.com*",
+    "*segment.io*",
+    "*doubleclick.net*",
+    "*intercom.io*",
+    "*zdassets.com*",
+]
+
+# Injected into every document: counts in-flight fetch/XHR requests so page
+# objects can wait for the network to go idle. window.__inflight(maxAge)
+# ignores requests older than maxAge ms (long-polling connections).
+NETWORK_TRACKER_JS = """
+(function () {
+    if (window.__inflight) { return; }
+    var pending = {}, nextId = 0;
+    function start() { var id = ++nextId; pending[id] = Date.now(); return id; }
+    function finish(id) { delete pending[id]; }
+
+    window.__inflight = function (maxAge) {
+        var now = Date.now(), count = 0;
+        for (var id in pending) {
+            if (now - pending[id] < maxAge) { count++; }
+        }
+        return count;
+    };
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            var id = start();
+            try {
+                return originalFetch.apply(this, arguments).finally(function () { finish(id); });
+            } catch (e) {
+                finish(id);
+                throw e;
+            }
+        };
+    }
+
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var id = start();
+        this.addEventListener('loadend', function () { finish(id); });
+        try {
+            return originalSend.apply(this, arguments);
+        } catch (e) {
+            finish(id);
+            throw e;
+        }
+    };
+})();
+"""
+
+
 @pytest.fixture(scope="session")
 def base_url():
     """
@@ -22,19 +83,77 @@ def base_url():
     return os.getenv('APP_BASE_URL', 'https://useinsider.com')
 
 
-@pytest.fixture(scope="function")
-def driver(base_url):
+@pytest.fixture(scope="session")
+def chromedriver_path():
+    """
+    Resolve the local ChromeDriver binary once per test run.
+
+    WebDriver Manager checks its cache (and possibly the network) on every
+    install() call, so the lookup is shared by all tests.
+    """
+    path = ChromeDriverManager().install()
+
+    # Fix path if it points to non-executable file (workaround for webdriver_manager bug)
+    if 'THIRD_PARTY_NOTICES' in path or 'LICENSE' in path:
+        path = os.path.join(os.path.dirname(path), 'chromedriver')
+
+    return path
+
+
+@pytest.fixture(scope="session")
+def chrome_options():
+    """
+    Chrome options shared by every test.
+
+    Remote (Kubernetes/Docker) runs get the headless container flags,
+    local runs just open a maximized window. Images are never loaded.
+    """
+    options = Options()
+
+    if os.getenv('CHROME_SERVICE_URL'):
+        options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--window-size=1920,1080')
+
+        # Return from driver.get() at DOMContentLoaded instead of the full
+        # load event (analytics beacons, lazy media)
+        options.page_load_strategy = 'eager'
+
+    # Tests only assert on layout/text, never on images
+    options.add_experimental_option(
+        'prefs', {'profile.managed_default_content_settings.images': 2}
+    )
+    options.add_argument('--start-maximized')
+    return options
+
+
+def _execute_cdp_cmd(driver_instance, cmd, params=None):
+    """
+    Run a Chrome DevTools Protocol command.
+
+    Works for both local and remote sessions as long as the remote session
+    was created with a ChromiumRemoteConnection.
+    """
+    return driver_instance.execute(
+        "executeCdpCommand", {"cmd": cmd, "params": params or {}}
+    )["value"]
+
+
+@pytest.fixture(scope="session")
+def _browser(request, base_url, chrome_options):
     """
-    Setup Chrome WebDriver for tests.
+    Chrome WebDriver session shared by all tests.
 
     Supports both local execution and remote execution (Kubernetes/Docker).
     Checks CHROME_SERVICE_URL environment variable to determine execution mode.
 
     Args:
+        request: Pytest request (used to resolve chromedriver_path lazily)
         base_url: Base URL fixture (for logging purposes)
+        chrome_options: Shared Chrome options fixture
     """
-    chrome_options = Options()
-
     # Check if running in container/K8s environment
     chrome_service_url = os.getenv('CHROME_SERVICE_URL')
 
@@ -42,43 +161,68 @@ def driver(base_url):
         # Remote WebDriver for Kubernetes/Docker environment
         print(f"Using Remote WebDriver at: {chrome_service_url}")
         print(f"Testing against: {base_url}")
-        chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--start-maximized')
 
+        # Chrome-aware connection so CDP commands reach the remote browser
         driver_instance = webdriver.Remote(
-            command_executor=chrome_service_url,
+            command_executor=ChromiumRemoteConnection(
+                chrome_service_url, vendor_prefix="goog", browser_name="chrome"
+            ),
             options=chrome_options
         )
     else:
         # Local WebDriver for development
         print("Using Local WebDriver")
         print(f"Testing against: {base_url}")
-        chrome_options.add_argument('--start-maximized')
 
-        # Use WebDriver Manager to handle ChromeDriver installation
-        chromedriver_path = ChromeDriverManager().install()
+        # ChromeDriver is only needed locally, so resolve it on demand
+        service = Service(request.getfixturevalue('chromedriver_path'))
+        driver_instance = webdriver.Chrome(service=service, options=chrome_options)
 
-        # Fix path if it points to non-executable file (workaround for webdriver_manager bug)
-        if 'THIRD_PARTY_NOTICES' in chromedriver_path or 'LICENSE' in chromedriver_path:
-            driver_dir = os.path.dirname(chromedriver_path)
-            chromedriver_path = os.path.join(driver_dir, 'chromedriver')
+    # No implicit wait: page objects use explicit WebDriverWait everywhere,
+    # and mixing both makes every missing-element poll block for longer
+    driver_instance.implicitly_wait(0)
 
-        service = Service(chromedriver_path)
-        driver_instance = webdriver.Chrome(service=service, options=chrome_options)
+    # Block trackers before the first navigation; they only slow page loads
+    _execute_cdp_cmd(driver_instance, "Network.enable")
+    _execute_cdp_cmd(driver_instance, "Network.setBlockedURLs", {"urls": BLOCKED_URLS})
 
-    # Set implicit wait
-    driver_instance.implicitly_wait(10)
+    # Expose in-flight request count to page objects (see NETWORK_TRACKER_JS)
+    _execute_cdp_cmd(driver_instance, "Page.addScriptToEvaluateOnNewDocument",
+                     {"source": NETWORK_TRACKER_JS})
 
     yield driver_instance
 
-    # Teardown: quit driver after test
+    # Teardown: quit driver after the whole test session
     driver_instance.quit()
 
 
+@pytest.fixture(scope="function")
+def driver(_browser):
+    """
+    Per-test handle on the shared browser session.
+
+    Clears cookies and the HTTP cache before each test. Afterwards closes
+    any windows/tabs the test opened (e.g. View Role on Lever) and clears
+    localStorage/sessionStorage so the next test starts clean.
+    """
+    _browser.delete_all_cookies()
+    _execute_cdp_cmd(_browser, "Network.clearBrowserCache")
+
+    yield _browser
+
+    # Teardown: return to the main window for the next test
+    main_window = _browser.window_handles[0]
+    for handle in _browser.window_handles[1:]:
+        _browser.switch_to.window(handle)
+        _browser.close()
+    _browser.switch_to.window(main_window)
+
+    try:
+        _browser.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException:
+        pass  # Pages like data: or about:blank have no web storage
+
+
 # Add custom markers for test categorization
 def pytest_configure(config):
     """Configure custom markers"""
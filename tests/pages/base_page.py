@@ -11,6 +11,9 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class BasePage:
     """Base class for all page objects"""
 
+    # Explicit wait polling interval in seconds (Selenium default is 0.5)
+    POLL_FREQUENCY = 0.1
+
     def __init__(self, driver, base_url="https://useinsider.com"):
         """
         Initialize base page
@@ -21,7 +24,19 @@ class BasePage:
         """
         self.driver = driver
         self.base_url = base_url
-        self.wait = WebDriverWait(driver, 15)  # 15 seconds explicit wait
+        self.wait = self._wait(15)  # 15 seconds explicit wait
+
+    def _wait(self, timeout):
+        """
+        Create an explicit wait that polls every POLL_FREQUENCY seconds
+
+        Args:
+            timeout: Maximum time to wait
+
+        Returns:
+            WebDriverWait instance
+        """
+        return WebDriverWait(self.driver, timeout, poll_frequency=self.POLL_FREQUENCY)
 
     def find_element(self, locator, timeout=15):
         """
@@ -35,7 +50,7 @@ class BasePage:
             WebElement if found
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             return wait.until(EC.presence_of_element_located(locator))
         except TimeoutException:
             raise NoSuchElementException(f"Element not found: {locator}")
@@ -51,7 +66,7 @@ class BasePage:
         Returns:
             List of WebElements
         """
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout)
         return wait.until(EC.presence_of_all_elements_located(locator))
 
     def click(self, locator, timeout=15):
@@ -62,7 +77,7 @@ class BasePage:
             locator: Tuple of (By.TYPE, "locator_value")
             timeout: Maximum time to wait
         """
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout)
         element = wait.until(EC.element_to_be_clickable(locator))
         element.click()
 
@@ -104,12 +119,38 @@ class BasePage:
             Boolean: True if displayed, False otherwise
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             element = wait.until(EC.visibility_of_element_located(locator))
             return element.is_displayed()
         except (TimeoutException, NoSuchElementException):
             return False
 
+    def batch_visible(self, locators):
+        """
+        Check visibility of several elements in a single browser round-trip
+
+        Args:
+            locators: List of (By.TYPE, "locator_value") tuples
+                      (By.CSS_SELECTOR, By.XPATH or By.ID)
+
+        Returns:
+            List of booleans in the same order as locators
+        """
+        return self.driver.execute_script("""
+            return arguments[0].map(function (locator) {
+                var by = locator[0], value = locator[1], el;
+                if (by === 'xpath') {
+                    el = document.evaluate(value, document, null,
+                        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                } else if (by === 'id') {
+                    el = document.getElementById(value);
+                } else {
+                    el = document.querySelector(value);
+                }
+                return !!(el && el.offsetParent !== null);
+            });
+        """, [list(locator) for locator in locators])
+
     def wait_for_url_contains(self, url_fragment, timeout=15):
         """
         Wait for URL to contain specific fragment
@@ -121,7 +162,7 @@ class BasePage:
         Returns:
             Boolean: True if URL contains fragment
         """
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout)
         return wait.until(EC.url_contains(url_fragment))
 
     def get_current_url(self):
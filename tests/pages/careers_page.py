@@ -2,6 +2,7 @@
 Careers Page Object Model
 """
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from tests.pages.base_page import BasePage
 
 
@@ -12,10 +13,11 @@ class CareersPage(BasePage):
     LOCATIONS_BLOCK = (By.CSS_SELECTOR, "#career-our-location")
     TEAMS_BLOCK = (By.CSS_SELECTOR, "#career-find-our-calling")
     # Life at Insider section doesn't have ID, so we locate by heading text
+    # (exact text() match on <h2> only; CSS cannot select by text)
     LIFE_AT_INSIDER_BLOCK = (By.XPATH, "//h2[text()='Life at Insider']")
 
     # QA jobs page link
-    SEE_ALL_QA_JOBS = (By.XPATH, "//a[contains(text(),'See all QA jobs')]")
+    SEE_ALL_QA_JOBS = (By.CSS_SELECTOR, "a[href*='qualityassurance']")
 
     def __init__(self, driver, base_url):
         """Initialize careers page with base URL"""
@@ -50,11 +52,12 @@ class CareersPage(BasePage):
         Returns:
             Boolean: True if all blocks are visible
         """
-        return (
-            self.is_locations_block_displayed() and
-            self.is_teams_block_displayed() and
-            self.is_life_at_insider_block_displayed()
-        )
+        blocks = [self.LOCATIONS_BLOCK, self.TEAMS_BLOCK, self.LIFE_AT_INSIDER_BLOCK]
+        try:
+            # One JS evaluation per poll instead of three separate waits
+            return self._wait(10).until(lambda driver: all(self.batch_visible(blocks)))
+        except TimeoutException:
+            return False
 
     def click_see_all_qa_jobs(self):
         """Navigate to QA jobs listing page"""
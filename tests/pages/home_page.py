@@ -9,8 +9,8 @@ class HomePage(BasePage):
     """Page object for Insider homepage"""
 
     # Locators
-    COMPANY_MENU = (By.XPATH, "//a[contains(text(),'Company')]")
-    CAREERS_MENU_ITEM = (By.XPATH, "//a[contains(text(),'Careers')]")
+    COMPANY_MENU = (By.XPATH, "//a[contains(text(),'Company')]")  # dropdown toggle, href="#"
+    CAREERS_MENU_ITEM = (By.CSS_SELECTOR, "nav a[href$='/careers/']")
     ACCEPT_COOKIES = (By.ID, "wt-cli-accept-all-btn")
     LOGO = (By.CSS_SELECTOR, "#navigation > div > a > img")
 
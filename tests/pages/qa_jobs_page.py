@@ -5,16 +5,28 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver import ActionChains
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+import logging
 import time
 from functools import wraps
 from tests.pages.base_page import BasePage
 
 
+log = logging.getLogger(__name__)
+
+
 def retry_on_stale_element(max_attempts=3):
     """
     Decorator to retry on StaleElementReferenceException
-    
+
+    Backs off exponentially (50ms, 100ms, ... capped at 500ms) since the
+    stale window after a re-render is usually only a few milliseconds.
+
     Args:
         max_attempts: Maximum number of retry attempts
     
@@ -30,7 +42,7 @@ def retry_on_stale_element(max_attempts=3):
                 except StaleElementReferenceException:
                     if attempt == max_attempts - 1:
                         raise
-                    time.sleep(0.5)
+                    time.sleep(min(0.5, 0.05 * (2 ** attempt)))
             return None
         return wrapper
     return decorator
@@ -40,11 +52,15 @@ class QAJobsPage(BasePage):
     """Page object for QA Jobs listing and filtering"""
 
     # Locators
-    SEE_ALL_QA_JOBS_BUTTON = (By.XPATH, "//a[contains(text(),'See all QA jobs')]")
+    SEE_ALL_QA_JOBS_BUTTON = (By.CSS_SELECTOR, "a[href*='qualityassurance']")
 
     LOCATION_FILTER = (By.ID, "select2-filter-by-location-container")
     DEPARTMENT_FILTER = (By.ID, "select2-filter-by-department-container")
 
+    # Underlying <select> elements wrapped by Select2
+    LOCATION_SELECT_ID = "filter-by-location"
+    DEPARTMENT_SELECT_ID = "filter-by-department"
+
     JOB_LIST_CONTAINER = (By.ID, "jobs-list")
     JOB_ITEMS = (By.CSS_SELECTOR, ".position-list-item")
 
@@ -52,23 +68,43 @@ class QAJobsPage(BasePage):
     JOB_POSITION = (By.CSS_SELECTOR, ".position-title")
     JOB_DEPARTMENT = (By.CSS_SELECTOR, ".position-department")
     JOB_LOCATION = (By.CSS_SELECTOR, ".position-location")
-    VIEW_ROLE_BUTTON = (By.XPATH, ".//a[contains(text(),'View Role')]")
-
-    # Variables (webdriver wait time)
-    WAIT_TIME = 60
+    VIEW_ROLE_BUTTON = (By.CSS_SELECTOR, "a[href*='jobs.lever.co']")  # scoped to a job card
+
+    # Wait budgets (seconds): fail fast where the operation is known to be quick
+    SHORT_WAIT = 5    # dropdown open/select, element clickable
+    MEDIUM_WAIT = 15  # URL change, job list reload
+    LONG_WAIT = 60    # initial page navigation and first job list load
+
+    # True once a job card with a link is rendered, the first card matches the
+    # expected department (substring) and location (exact) - empty expectations
+    # match anything - and no fetch/XHR request is in flight.
+    # Arguments: expected department, expected location, then the card,
+    # link, department and location selectors.
+    _FIRST_MATCH_READY_JS = """
+        var department = arguments[0], location = arguments[1];
+        if (!document.querySelector(arguments[2] + ' ' + arguments[3])) { return false; }
+        var card = document.querySelector(arguments[2]);
+        var dept = card.querySelector(arguments[4]);
+        var loc = card.querySelector(arguments[5]);
+        if (department && !(dept && dept.innerText.trim().indexOf(department) !== -1)) { return false; }
+        if (location && !(loc && loc.innerText.trim() === location)) { return false; }
+        return typeof window.__inflight !== 'function' || window.__inflight(5000) === 0;
+    """
 
 
     def __init__(self, driver, base_url):
         """Initialize QA jobs page with base URL"""
         super().__init__(driver, base_url)
         self.url = f"{self.base_url}/careers/quality-assurance/"
+        # Department filter element, cached after the first lookup
+        self._department_filter = None
 
     def open(self):
         """Navigate to QA careers page"""
         self.navigate_to(self.url)
         
         # Wait for page to load
-        WebDriverWait(self.driver, self.WAIT_TIME).until(
+        WebDriverWait(self.driver, self.LONG_WAIT).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
 
@@ -78,12 +114,12 @@ class QAJobsPage(BasePage):
         self.driver.execute_script("arguments[0].click();", element)
 
         # Wait for URL to change to open positions page
-        WebDriverWait(self.driver, self.WAIT_TIME).until(
+        WebDriverWait(self.driver, self.MEDIUM_WAIT).until(
             EC.url_contains("/careers/open-positions")
         )
 
         # Wait for job list container to be present
-        WebDriverWait(self.driver, self.WAIT_TIME).until(
+        WebDriverWait(self.driver, self.LONG_WAIT).until(
             EC.presence_of_element_located(self.JOB_LIST_CONTAINER)
         )
 
@@ -92,19 +128,18 @@ class QAJobsPage(BasePage):
         self.driver.execute_script("arguments[0].scrollIntoView({block: 'start', behavior: 'smooth'});", filter_section)
 
         # Wait for department filter element to be visible after scroll
-        WebDriverWait(self.driver, self.WAIT_TIME).until(
+        self._department_filter = WebDriverWait(self.driver, self.MEDIUM_WAIT).until(
             EC.visibility_of_element_located(self.DEPARTMENT_FILTER)
         )
-        time.sleep(2)  # Allow JS to trigger auto-selection
 
         # CRITICAL: Block until department filter changes from "All" to specific value
-        print(f"[INFO] Waiting for department auto-selection...")
-        self._ensure_department_not_all(timeout=self.WAIT_TIME)
-        print(f"[INFO] Department auto-selection complete!")
+        log.info("Waiting for department auto-selection...")
+        self._ensure_department_not_all(timeout=self.LONG_WAIT)
+        log.info("Department auto-selection complete!")
         
         # Wait for job list to stabilize after department filter auto-selection
         # Jobs reload couple of times after filter change
-        self._wait_for_jobs_stable(max_stable_checks=6)
+        self._wait_for_jobs_stable(stable_for=1.5)
 
     def filter_by_location(self, location="Istanbul, Turkiye", expected_department="Quality Assurance"):
         """
@@ -114,23 +149,106 @@ class QAJobsPage(BasePage):
             location: Location name to filter (e.g., "Istanbul, Turkiye", "Ankara, Turkey", etc.)
             expected_department: Expected department value (for verification only, page should already be ready)
         """
-        # CRITICAL: Department MUST NOT be "All" - WAIT if needed!
-        # This is a safety net in case async JS delays from previous operation
-        print(f"[SAFETY CHECK] Verifying department is not 'All' before location filtering...")
-        self._ensure_department_not_all(timeout=10)  # Give it 10 seconds max
-        print(f"[SAFETY CHECK] Department verified!")
-        
-        # Wait for location filter to be visible and clickable
-        WebDriverWait(self.driver, self.WAIT_TIME).until(
-            EC.visibility_of_element_located(self.LOCATION_FILTER)
+        # Department auto-selection was already awaited in click_see_all_qa_jobs()
+
+        # Fast path: select through the Select2 jQuery API in one call
+        if not self._select2_set_value(self.LOCATION_SELECT_ID, location):
+            self._select_location_from_dropdown(location)
+
+        # Wait for jobs to reload with the first card matching the filter
+        self._wait_for_first_match(expected_department, location)
+
+        # Wait for job list to stabilize with matching criteria
+        self._wait_for_jobs_stable(
+            expected_department=expected_department,
+            expected_location=location
         )
-        WebDriverWait(self.driver, self.WAIT_TIME).until(
-            EC.element_to_be_clickable(self.LOCATION_FILTER)
+
+    def filter_by_department(self, department="Quality Assurance"):
+        """
+        Filter jobs by department
+
+        Args:
+            department: Department name to filter (e.g., "Quality Assurance", "Security", etc.)
+        """
+        # Fast path: select through the Select2 jQuery API in one call
+        if not self._select2_set_value(self.DEPARTMENT_SELECT_ID, department):
+            self._select_department_from_dropdown(department)
+
+        # Wait for jobs to reload with the first card matching the filter
+        self._wait_for_first_match(department)
+
+        # Callers read every card next; the list can reload several times
+        # with wrong results after the first card already matches
+        self._wait_for_jobs_stable(expected_department=department, stable_for=0.5)
+
+    def _wait_for_first_match(self, expected_department=None, expected_location=None):
+        """
+        Wait until the filtered job list is rendered and the network is idle
+
+        Evaluates _FIRST_MATCH_READY_JS, so each poll is a single script call.
+
+        Args:
+            expected_department: Department the first job should contain (optional)
+            expected_location: Location the first job should have (optional)
+        """
+        WebDriverWait(self.driver, self.MEDIUM_WAIT, poll_frequency=0.25).until(
+            lambda d: d.execute_script(
+                self._FIRST_MATCH_READY_JS,
+                expected_department or "", expected_location or "",
+                self.JOB_ITEMS[1], "a[href]", self.JOB_DEPARTMENT[1], self.JOB_LOCATION[1]
+            )
         )
 
+    def _select2_set_value(self, select_id, option_text):
+        """
+        Select a Select2 option through the page's jQuery API
+
+        Sets the value of the underlying <select> and triggers 'change',
+        which is what Select2 does on a user click, in one script call.
+
+        Args:
+            select_id: ID of the underlying <select> element
+            option_text: Text (or part of it) of the option to select
+
+        Returns:
+            bool: True if selected, False if jQuery or the option is not available
+        """
+        try:
+            return self.driver.execute_script("""
+                var select = document.getElementById(arguments[0]);
+                var text = arguments[1];
+                if (!window.jQuery || !select) {
+                    return false;
+                }
+                var option = Array.from(select.options).find(function (o) {
+                    return o.text.indexOf(text) !== -1;
+                });
+                if (!option) {
+                    return false;
+                }
+                window.jQuery(select).val(option.value).trigger('change');
+                return true;
+            """, select_id, option_text)
+        except WebDriverException:
+            return False
+
+    def _select_location_from_dropdown(self, location):
+        """
+        Select location by opening the Select2 dropdown and clicking the option
+
+        Args:
+            location: Location name to select
+        """
+        # Wait for location filter to be visible and clickable (checked in the same tick)
+        WebDriverWait(self.driver, self.SHORT_WAIT).until(EC.all_of(
+            EC.visibility_of_element_located(self.LOCATION_FILTER),
+            EC.element_to_be_clickable(self.LOCATION_FILTER)
+        ))
+
         self.click(self.LOCATION_FILTER)
 
-        wait = WebDriverWait(self.driver, self.WAIT_TIME)
+        wait = WebDriverWait(self.driver, self.SHORT_WAIT)
         dropdown_container = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, ".select2-results__options")))
 
         # Wait for dropdown options to be present and visible
@@ -144,49 +262,18 @@ class QAJobsPage(BasePage):
         option_position = self.driver.execute_script("return arguments[0].offsetTop;", location_option)
         self.driver.execute_script("arguments[0].scrollTop = arguments[1] - 100;", dropdown_container, option_position)
 
-        self.driver.execute_script("""
-            var element = arguments[0];
-            var event = new MouseEvent('mousedown', {
-                bubbles: true,
-                cancelable: true,
-                view: window
-            });
-            element.dispatchEvent(event);
-
-            var event2 = new MouseEvent('mouseup', {
-                bubbles: true,
-                cancelable: true,
-                view: window
-            });
-            element.dispatchEvent(event2);
-
-            element.click();
-        """, location_option)
-
-        # Wait for jobs to reload and at least one job to be clickable after filter
-        WebDriverWait(self.driver, self.WAIT_TIME).until(
-            EC.presence_of_all_elements_located(self.JOB_ITEMS)
-        )
-        WebDriverWait(self.driver, self.WAIT_TIME).until(
-            EC.element_to_be_clickable(self.JOB_ITEMS)
-        )
-
-        # Wait for job list to stabilize with matching criteria
-        self._wait_for_jobs_stable(
-            expected_department=expected_department,
-            expected_location=location
-        )
+        self._click_select2_option(location_option)
 
-    def filter_by_department(self, department="Quality Assurance"):
+    def _select_department_from_dropdown(self, department):
         """
-        Filter jobs by department
+        Select department by opening the Select2 dropdown and clicking the option
 
         Args:
-            department: Department name to filter (e.g., "Quality Assurance", "Security", etc.)
+            department: Department name to select
         """
         self.click(self.DEPARTMENT_FILTER)
 
-        wait = WebDriverWait(self.driver, self.WAIT_TIME)
+        wait = WebDriverWait(self.driver, self.SHORT_WAIT)
         dropdown_container = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, ".select2-results__options")))
 
         # Wait for dropdown options to be present
@@ -198,36 +285,25 @@ class QAJobsPage(BasePage):
         option_position = self.driver.execute_script("return arguments[0].offsetTop;", department_option)
         self.driver.execute_script("arguments[0].scrollTop = arguments[1] - 100;", dropdown_container, option_position)
 
-        self.driver.execute_script("""
-            var element = arguments[0];
-            var event = new MouseEvent('mousedown', {
-                bubbles: true,
-                cancelable: true,
-                view: window
-            });
-            element.dispatchEvent(event);
+        self._click_select2_option(department_option)
 
-            var event2 = new MouseEvent('mouseup', {
+    def _click_select2_option(self, option):
+        """
+        Select an open Select2 dropdown option
+
+        Select2 selects results on 'mouseup'; extra mousedown/click events only
+        trigger additional job list reloads.
+
+        Args:
+            option: Option <li> WebElement
+        """
+        self.driver.execute_script("""
+            arguments[0].dispatchEvent(new MouseEvent('mouseup', {
                 bubbles: true,
                 cancelable: true,
                 view: window
-            });
-            element.dispatchEvent(event2);
-
-            element.click();
-        """, department_option)
-
-        # Wait for jobs to reload after department filter
-        WebDriverWait(self.driver, self.WAIT_TIME).until(
-            EC.presence_of_all_elements_located(self.JOB_ITEMS)
-        )
-        # Wait for first job to be clickable (animation/dynamic)
-        WebDriverWait(self.driver, self.WAIT_TIME).until(
-            EC.element_to_be_clickable(self.JOB_ITEMS)
-        )
-
-        # Wait for job list to stabilize with matching criteria
-        self._wait_for_jobs_stable(expected_department=department, max_stable_checks=2)
+            }));
+        """, option)
 
     def _ensure_department_not_all(self, timeout=60):
         """
@@ -243,138 +319,105 @@ class QAJobsPage(BasePage):
             bool: True if department is not "All"
 
         Raises:
-            Exception: If department is still "All" after timeout or if element cannot be found
+            Exception: If department is still "All" (or missing) after timeout
         """
         start_time = time.time()
-        max_wait = start_time + timeout
         last_department_text = None
-        consecutive_element_failures = 0
-        max_element_failures = 10  # Allow up to 10 consecutive element lookup failures
 
-        print(f"[DEBUG] Starting department filter check (timeout={timeout}s)...")
+        wait = WebDriverWait(
+            self.driver, timeout, poll_frequency=0.25,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+        )
+
+        def department_selected(driver):
+            nonlocal last_department_text
+            last_department_text = self._department_filter_text()
+            # CRITICAL FIX: Check if "All" is in the text (handles '× All', '×\nAll', etc.)
+            return bool(last_department_text) and "All" not in last_department_text
+
+        try:
+            wait.until(department_selected)
+        except TimeoutException:
+            # TIMEOUT: Department filter is still "All" (or never changed from it)
+            elapsed = time.time() - start_time
+            error_msg = f"TIMEOUT: Department still 'All' after {elapsed:.1f}s (last value: '{last_department_text}'). "
+            error_msg += f"Expected auto-select to 'Quality Assurance' or similar. Page not ready!"
+            raise Exception(error_msg)
 
-        while time.time() < max_wait:
-            try:
-                # Try to find the department filter element
-                department_element = self.driver.find_element(By.ID, "select2-filter-by-department-container")
-                department_text = department_element.text.strip()
-
-                # Reset failure counter on successful element access
-                consecutive_element_failures = 0
-                last_department_text = department_text
-
-                # Debug: Show raw text
-                print(f"[DEBUG] Raw department text: {repr(department_text)}")
-
-                # CRITICAL FIX: Check if "All" is in the text (handles '× All', '×\nAll', etc.)
-                # SUCCESS: Department is not "All" and not empty
-                if department_text and "All" not in department_text:
-                    elapsed = time.time() - start_time
-                    print(f"[SUCCESS] Department filter ready: '{department_text}' (waited {elapsed:.1f}s)")
-                    return True
-
-                # Still contains "All", keep waiting
-                print(f"[DEBUG] Department contains 'All' (value: {repr(department_text)}), waiting... (elapsed: {time.time() - start_time:.1f}s)")
-                time.sleep(1)
-
-            except Exception as e:
-                # Element not found or other error
-                consecutive_element_failures += 1
-                print(f"[WARNING] Failed to read department filter (attempt {consecutive_element_failures}/{max_element_failures}): {str(e)}")
-
-                # If too many consecutive failures, something is seriously wrong
-                if consecutive_element_failures >= max_element_failures:
-                    elapsed = time.time() - start_time
-                    raise Exception(f"Cannot find department filter after {consecutive_element_failures} attempts ({elapsed:.1f}s). Page loading issue!")
-
-                time.sleep(1)
-                continue
-
-        # TIMEOUT: Department filter is still "All" (or never changed from it)
         elapsed = time.time() - start_time
-        error_msg = f"TIMEOUT: Department still 'All' after {elapsed:.1f}s (last value: '{last_department_text}'). "
-        error_msg += f"Expected auto-select to 'Quality Assurance' or similar. Page not ready!"
-        raise Exception(error_msg)
+        log.info("Department filter ready: '%s' (waited %.1fs)", last_department_text, elapsed)
+        return True
+
+    def _department_filter_text(self):
+        """
+        Read department filter text through the cached element reference
+
+        The element is (re-)fetched only when it was never looked up or has
+        gone stale after a re-render.
+
+        Returns:
+            String: Stripped department filter text
+        """
+        if self._department_filter is not None:
+            try:
+                return self._department_filter.text.strip()
+            except StaleElementReferenceException:
+                pass
+        self._department_filter = self.driver.find_element(*self.DEPARTMENT_FILTER)
+        return self._department_filter.text.strip()
 
-    def _wait_for_jobs_stable(self, expected_department=None, expected_location=None, max_stable_checks=3):
+    def _wait_for_jobs_stable(self, expected_department=None, expected_location=None,
+                              stable_for=0.5, poll_interval=0.1):
         """
         Wait for job list to stabilize after filter application
 
+        The list counts as stable once no fetch/XHR request is in flight and
+        the job cards have not changed for stable_for seconds.
+
         Args:
             expected_department: Expected department value to match (optional)
             expected_location: Expected location value to match (optional)
-            max_stable_checks: Number of consecutive stable checks required
+            stable_for: Seconds the job list must stay unchanged
+            poll_interval: Seconds between job list snapshots
 
         Returns:
             bool: True if stable jobs found matching criteria
         """
-        print(f"[DEBUG] _wait_for_jobs_stable called with: dept={expected_department}, loc={expected_location}, checks={max_stable_checks}")
-        stable_count = None
-        stable_checks = 0
-        timeout = time.time() + self.WAIT_TIME
-        
+        last_cards = None
+        stable_since = None
+        polls = 0
+        timeout = time.time() + self.MEDIUM_WAIT
+
         while time.time() < timeout:
-            jobs = self.driver.find_elements(*self.JOB_ITEMS)
-            job_count = len(jobs)
-            
-            # If no criteria specified, just check stability (job count)
-            if not expected_department and not expected_location:
-                # Track stability
-                if stable_count is None:
-                    stable_count = job_count
-                    stable_checks = 1
-                elif job_count == stable_count and job_count > 0:
-                    stable_checks += 1
-                else:
-                    stable_count = job_count
-                    stable_checks = 1
-                
-                # Exit if stable
-                if stable_checks >= max_stable_checks:
-                    return True
-            else:
-                # Check if any job matches expected criteria
-                matches = False
-                first_job_info = None
-                for job in jobs:
-                    try:
-                        department = job.find_element(*self.JOB_DEPARTMENT).text if expected_department else None
-                        location = job.find_element(*self.JOB_LOCATION).text if expected_location else None
-
-                        # Debug: Log first job details
-                        if first_job_info is None:
-                            first_job_info = f"dept='{department}', loc='{location}'"
-
-                        # Check match conditions
-                        department_match = (not expected_department) or (expected_department in department)
-                        location_match = (not expected_location) or (expected_location == location)
-
-                        if department_match and location_match:
-                            matches = True
-                            break
-                    except Exception:
-                        continue
-
-                # Debug: Log matching status
-                if first_job_info:
-                    print(f"[DEBUG] First job: {first_job_info}, matches={matches}, stable_checks={stable_checks}/{max_stable_checks}")
-                
-                # Track stability
-                if stable_count is None:
-                    stable_count = job_count
-                    stable_checks = 1
-                elif job_count == stable_count:
-                    stable_checks += 1
-                else:
-                    stable_count = job_count
-                    stable_checks = 1
-                
-                # Exit if stable and matching
-                if matches and stable_checks >= max_stable_checks:
-                    return True
-            
-            time.sleep(1)
-        
+            # One browser call returns pending requests and the text of every
+            # card; the card snapshot is the stability fingerprint
+            inflight, cards = self._read_jobs_snapshot()
+            polls += 1
+            now = time.time()
+
+            # Track stability
+            if inflight or not cards or cards != last_cards:
+                stable_since = now
+            last_cards = cards
+            stable_duration = now - stable_since
+
+            # Check if any job matches expected criteria
+            matches = any(
+                ((not expected_department) or (expected_department in department)) and
+                ((not expected_location) or (expected_location == location))
+                for _, department, location in cards
+            )
+
+            # Exit if stable and matching
+            if matches and stable_duration >= stable_for:
+                log.debug("Jobs stable after %d polls (dept=%s, loc=%s, %d jobs)",
+                          polls, expected_department, expected_location, len(cards))
+                return True
+
+            time.sleep(poll_interval)
+
+        log.warning("Jobs not stable after %d polls (dept=%s, loc=%s, last=%s)",
+                    polls, expected_department, expected_location, last_cards[:1] if last_cards else None)
         return False
 
     def get_all_jobs(self):
@@ -448,6 +491,53 @@ class QAJobsPage(BasePage):
                 return jobs[0].find_element(*self.JOB_LOCATION).text
             return ""
 
+    def fetch_all_job_details(self):
+        """
+        Get position, department and location of every job card
+
+        Reads all cards in a single execute_script call instead of three
+        find_element roundtrips per job.
+
+        Returns:
+            List of (position, department, location) tuples
+        """
+        self.wait.until(EC.presence_of_all_elements_located(self.JOB_ITEMS))
+        return self._read_job_cards()
+
+    def _read_job_cards(self):
+        """
+        Read (position, department, location) of every job card currently in the DOM
+
+        Returns:
+            List of tuples, empty if no cards are rendered
+        """
+        return self._read_jobs_snapshot()[1]
+
+    def _read_jobs_snapshot(self):
+        """
+        Read pending network requests and all job cards in one script call
+
+        The request count comes from the tracker conftest injects into every
+        page; it is 0 when the tracker is not installed.
+
+        Returns:
+            Tuple (inflight, cards): number of in-flight fetch/XHR requests
+            started within the last 5s, and list of
+            (position, department, location) tuples
+        """
+        inflight, rows = self.driver.execute_script("""
+            var fields = Array.prototype.slice.call(arguments, 1);
+            var cards = Array.from(document.querySelectorAll(arguments[0])).map(function (job) {
+                return fields.map(function (selector) {
+                    var el = job.querySelector(selector);
+                    return el ? el.innerText.trim() : '';
+                });
+            });
+            var inflight = typeof window.__inflight === 'function' ? window.__inflight(5000) : 0;
+            return [inflight, cards];
+        """, self.JOB_ITEMS[1], self.JOB_POSITION[1], self.JOB_DEPARTMENT[1], self.JOB_LOCATION[1])
+        return inflight, [tuple(row) for row in rows]
+
     def verify_job_details(self, job_element, expected_position_contains,
                           expected_department_contains, expected_location_contains):
         """
@@ -462,19 +552,43 @@ class QAJobsPage(BasePage):
         Returns:
             Boolean: True if all expectations match
         """
-        position = self.get_job_position(job_element)
-        department = self.get_job_department(job_element)
-        location = self.get_job_location(job_element)
+        return self.verify_job_detail_values(
+            self.get_job_position(job_element),
+            self.get_job_department(job_element),
+            self.get_job_location(job_element),
+            expected_position_contains,
+            expected_department_contains,
+            expected_location_contains
+        )
+
+    def verify_job_detail_values(self, position, department, location, expected_position_contains,
+                                 expected_department_contains, expected_location_contains):
+        """
+        Verify already fetched job details contain expected values
+
+        Args:
+            position: Position title
+            department: Department name
+            location: Location name
+            expected_position_contains: Expected string in position
+            expected_department_contains: Expected string in department
+            expected_location_contains: Expected string in location
 
+        Returns:
+            Boolean: True if all expectations match
+        """
         position_match = expected_position_contains in position
         department_match = expected_department_contains in department
         location_match = expected_location_contains in location
 
         if not all([position_match, department_match, location_match]):
-            print(f"Job verification failed:")
-            print(f"  Position: {position} (expected to contain '{expected_position_contains}')")
-            print(f"  Department: {department} (expected to contain '{expected_department_contains}')")
-            print(f"  Location: {location} (expected to contain '{expected_location_contains}')")
+            log.warning("Job verification failed:\n"
+                        "  Position: %s (expected to contain '%s')\n"
+                        "  Department: %s (expected to contain '%s')\n"
+                        "  Location: %s (expected to contain '%s')",
+                        position, expected_position_contains,
+                        department, expected_department_contains,
+                        location, expected_location_contains)
 
         return all([position_match, department_match, location_match])
 
@@ -487,9 +601,9 @@ class QAJobsPage(BasePage):
         """
         # CRITICAL: Ensure jobs are fully stable before clicking
         # The site reloads jobs 3-4 times with wrong results after filtering!
-        print("[INFO] Ensuring jobs are fully stable before clicking View Role...")
-        self._wait_for_jobs_stable(max_stable_checks=3)
-        print("[INFO] Jobs confirmed stable!")
+        log.info("Ensuring jobs are fully stable before clicking View Role...")
+        self._wait_for_jobs_stable()
+        log.info("Jobs confirmed stable!")
 
         # IMPORTANT: Get fresh job references AFTER stability check
         # Retry mechanism to handle any remaining stale element issues
@@ -501,18 +615,21 @@ class QAJobsPage(BasePage):
                     first_job = jobs[0]
                     # Scroll to job element
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", first_job)
-                    time.sleep(0.5)
-                    # Find and click View Role button
-                    view_role_btn = first_job.find_element(*self.VIEW_ROLE_BUTTON)
+                    # Wait for View Role button inside the job card, then click it
+                    # (a stale card propagates to the retry loop below)
+                    view_role_btn = WebDriverWait(
+                        self.driver, 5, poll_frequency=self.POLL_FREQUENCY,
+                        ignored_exceptions=(NoSuchElementException,)
+                    ).until(lambda driver: first_job.find_element(*self.VIEW_ROLE_BUTTON))
                     self.driver.execute_script("arguments[0].click();", view_role_btn)
-                    print(f"[SUCCESS] Clicked View Role button (attempt {attempt + 1})")
+                    log.info("Clicked View Role button (attempt %d)", attempt + 1)
                     return
             except StaleElementReferenceException:
                 if attempt < max_attempts - 1:
-                    print(f"[RETRY] Stale element on attempt {attempt + 1}, retrying...")
-                    time.sleep(1)
+                    log.warning("Stale element on attempt %d, retrying...", attempt + 1)
+                    time.sleep(min(0.5, 0.05 * (2 ** attempt)))
                 else:
-                    print(f"[ERROR] Failed after {max_attempts} attempts")
+                    log.error("Failed after %d attempts", max_attempts)
                     raise
 
     def is_redirected_to_lever(self):
@@ -522,11 +639,15 @@ class QAJobsPage(BasePage):
         Returns:
             Boolean: True if current URL contains 'lever.co' or 'jobs.lever.co'
         """
-        # Wait for URL to change and contain 'lever'
+        # The test has already switched to the new tab, so the URL is usually final
+        if "lever" in self.driver.current_url.lower():
+            return True
+
+        # Otherwise wait for URL to change and contain 'lever'
         try:
-            WebDriverWait(self.driver, self.WAIT_TIME).until(
+            self._wait(self.MEDIUM_WAIT).until(
                 lambda driver: "lever" in driver.current_url.lower()
             )
             return True
-        except:
+        except TimeoutException:
             return False
@@ -6,6 +6,17 @@ from tests.pages.home_page import HomePage
 from tests.pages.careers_page import CareersPage
 
 
+def _missing_blocks_message(careers_page):
+    """Build a failure message naming the blocks that are not displayed"""
+    checks = [
+        ("Locations", careers_page.is_locations_block_displayed),
+        ("Teams", careers_page.is_teams_block_displayed),
+        ("Life at Insider", careers_page.is_life_at_insider_block_displayed),
+    ]
+    missing = [name for name, is_displayed in checks if not is_displayed()]
+    return f"Blocks not displayed: {', '.join(missing) or 'none (transient)'}"
+
+
 @pytest.mark.careers
 def test_careers_page_navigation_and_blocks(driver, base_url):
     """
@@ -33,9 +44,8 @@ def test_careers_page_navigation_and_blocks(driver, base_url):
     # Verify careers page is opened
     assert careers_page.is_careers_page_opened(), "Careers page did not open"
 
-    # Verify all key blocks are displayed
-    assert careers_page.is_locations_block_displayed(), "Locations block is not displayed"
-    assert careers_page.is_teams_block_displayed(), "Teams block is not displayed"
-    assert careers_page.is_life_at_insider_block_displayed(), "Life at Insider block is not displayed"
+    # Verify all key blocks are displayed (one batched wait); the per-block
+    # checks in the message only run when the assertion fails
+    assert careers_page.verify_all_blocks_displayed(), _missing_blocks_message(careers_page)
 
     print("✓ Test 2 PASSED: Careers page navigation and all blocks verified")
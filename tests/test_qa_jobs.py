@@ -5,40 +5,58 @@ import pytest
 from tests.pages.qa_jobs_page import QAJobsPage
 
 
-@pytest.mark.careers
-def test_qa_jobs_filtering(driver, base_url):
+# The tests below share filtered_qa_jobs and must run in order on one
+# xdist worker (requires --dist loadgroup)
+pytestmark = pytest.mark.xdist_group("qa_jobs")
+
+
+@pytest.fixture(scope="module")
+def filtered_qa_jobs(_browser, base_url):
     """
-    Test 3: Filter QA jobs by Location and Department
+    QA jobs page filtered by Location and Department, shared by this module.
 
-    Steps:
-        1. Navigate to QA careers page
-        2. Click "See all QA jobs"
-        3. Filter by Location: Istanbul, Turkiye
-        4. Filter by Department: Quality Assurance
-        5. Verify jobs list is present
+    Opening the page and applying both filters is the slowest part of these
+    tests, so it runs once. Tests must not navigate away from the listing,
+    except test_view_role_redirects_to_lever which is kept last.
     """
-    # Initialize QA jobs page with base_url
-    qa_jobs_page = QAJobsPage(driver, base_url)
+    qa_jobs_page = QAJobsPage(_browser, base_url)
 
-    # Navigate to QA careers page
-    qa_jobs_page.open()
+    # Module fixtures run before the per-test driver reset, so start the
+    # shared setup from the same clean state as every other test
+    _browser.delete_all_cookies()
 
-    # Click "See all QA jobs" button
+    # Navigate to QA careers page and click "See all QA jobs"
+    qa_jobs_page.open()
     qa_jobs_page.click_see_all_qa_jobs()
 
     # Apply filters
     qa_jobs_page.filter_by_location("Istanbul, Turkiye")
     qa_jobs_page.filter_by_department("Quality Assurance")
 
+    return qa_jobs_page
+
+
+@pytest.mark.careers
+def test_qa_jobs_filtering(driver, filtered_qa_jobs):
+    """
+    Test 3: Filter QA jobs by Location and Department
+
+    Steps:
+        1. Navigate to QA careers page
+        2. Click "See all QA jobs"
+        3. Filter by Location: Istanbul, Turkiye
+        4. Filter by Department: Quality Assurance
+        5. Verify jobs list is present
+    """
     # Verify jobs are displayed
-    jobs = qa_jobs_page.get_all_jobs()
+    jobs = filtered_qa_jobs.get_all_jobs()
     assert len(jobs) > 0, "No jobs found after filtering"
 
     print(f"✓ Test 3 PASSED: Found {len(jobs)} QA jobs in Istanbul, Turkiye")
 
 
 @pytest.mark.careers
-def test_qa_jobs_details_verification(driver, base_url):
+def test_qa_jobs_details_verification(driver, filtered_qa_jobs):
     """
     Test 4: Verify all job details match filter criteria
 
@@ -50,26 +68,19 @@ def test_qa_jobs_details_verification(driver, base_url):
            - Department: "Quality Assurance"
            - Location: "Istanbul, Turkey"
     """
-    # Initialize QA jobs page with base_url
-    qa_jobs_page = QAJobsPage(driver, base_url)
-
-    # Navigate to QA careers page and click "See all QA jobs"
-    qa_jobs_page.open()
-    qa_jobs_page.click_see_all_qa_jobs()
-
-    # Apply filters
-    qa_jobs_page.filter_by_location("Istanbul, Turkiye")
-    qa_jobs_page.filter_by_department("Quality Assurance")
+    qa_jobs_page = filtered_qa_jobs
 
-    # Get all job listings
-    jobs = qa_jobs_page.get_all_jobs()
+    # Get details of all job listings in one browser call
+    jobs = qa_jobs_page.fetch_all_job_details()
     assert len(jobs) > 0, "No jobs to verify"
 
     # Verify each job
     failed_jobs = []
-    for index, job in enumerate(jobs):
-        is_valid = qa_jobs_page.verify_job_details(
-            job,
+    for index, (position, department, location) in enumerate(jobs):
+        is_valid = qa_jobs_page.verify_job_detail_values(
+            position,
+            department,
+            location,
             expected_position_contains="Quality Assurance",
             expected_department_contains="Quality Assurance",
             expected_location_contains="Istanbul, Turkiye"
@@ -85,7 +96,7 @@ def test_qa_jobs_details_verification(driver, base_url):
 
 
 @pytest.mark.careers
-def test_view_role_redirects_to_lever(driver, base_url):
+def test_view_role_redirects_to_lever(driver, filtered_qa_jobs):
     """
     Test 5: Verify clicking "View Role" redirects to Lever application form
 
@@ -94,16 +105,7 @@ def test_view_role_redirects_to_lever(driver, base_url):
         2. Click "View Role" on first job
         3. Verify redirect to Lever application form page
     """
-    # Initialize QA jobs page with base_url
-    qa_jobs_page = QAJobsPage(driver, base_url)
-
-    # Navigate to QA careers page and click "See all QA jobs"
-    qa_jobs_page.open()
-    qa_jobs_page.click_see_all_qa_jobs()
-    
-    # Apply filters
-    qa_jobs_page.filter_by_location("Istanbul, Turkiye")
-    qa_jobs_page.filter_by_department("Quality Assurance")
+    qa_jobs_page = filtered_qa_jobs
 
     # Click View Role on first job
     # Allow any scrolling animations to complete